@@ -2,6 +2,8 @@
 
 This module contains utility functions for validation and evaluation of Lightning IR models."""
 
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, Sequence
 
 import ir_measures
@@ -23,24 +25,30 @@ def create_run_from_scores(
         pd.DataFrame: DataFrame containing the run information with columns:
             query_id, q0, doc_id, score, rank, and system.
     """
-    num_docs = [len(ids) for ids in doc_ids]
+    num_docs = np.fromiter((len(ids) for ids in doc_ids), dtype=np.int64, count=len(doc_ids))
+    score_values = scores.float().numpy(force=True).reshape(-1)
+    # NOTE categorical codes instead of an object array of repeated strings, factorizing the (short) list of query ids
+    # also merges the blocks of duplicate query ids into a single ranking placed at the last occurrence of the id
+    query_codes, unique_query_ids = pd.factorize(np.asarray(query_ids))
+    last_positions = np.zeros(len(unique_query_ids), dtype=np.int64)
+    np.maximum.at(last_positions, query_codes, np.arange(len(query_codes)))
+    row_codes = np.repeat(query_codes, num_docs)
+    row_groups = last_positions[row_codes]
+    # a stable lexsort orders each query's rows by descending score (ties are broken by position like
+    # method="first") while keeping the order of the queries, so no further sorting is needed
+    order = np.lexsort((-score_values, row_groups))
+    sorted_groups = row_groups[order]
+    group_offsets = np.searchsorted(sorted_groups, sorted_groups, side="left")
     df = pd.DataFrame(
         {
-            "query_id": np.array(query_ids).repeat(num_docs),
+            "query_id": pd.Categorical.from_codes(row_codes[order], categories=unique_query_ids),
             "q0": 0,
-            "doc_id": sum(map(lambda x: list(x), doc_ids), []),
-            "score": scores.float().numpy(force=True).reshape(-1),
+            "doc_id": np.fromiter(chain.from_iterable(doc_ids), dtype=object, count=int(num_docs.sum()))[order],
+            "score": score_values[order],
             "system": "lightning_ir",
+            "rank": np.arange(1, len(order) + 1) - group_offsets,
         }
     )
-    df["rank"] = df.groupby("query_id")["score"].rank(ascending=False, method="first")
-
-    def key(series: pd.Series) -> pd.Series:
-        if series.name == "query_id":
-            return series.map({query_id: i for i, query_id in enumerate(query_ids)})
-        return series
-
-    df = df.sort_values(["query_id", "rank"], ascending=[True, True], key=key)
     return df
 
 
@@ -55,6 +63,11 @@ def create_qrels_from_dicts(qrels: Sequence[Dict[str, int]]) -> pd.DataFrame:
     return pd.DataFrame.from_records(qrels)
 
 
+@lru_cache(maxsize=None)
+def _parse_measure(measure: str) -> ir_measures.Measure:
+    return ir_measures.parse_measure(measure)
+
+
 def evaluate_run(run: pd.DataFrame, qrels: pd.DataFrame, measures: Sequence[str]) -> Dict[str, float]:
     """Convenience function to evaluate a run against qrels using a set of measures.
 
@@ -67,6 +80,8 @@ def evaluate_run(run: pd.DataFrame, qrels: pd.DataFrame, measures: Sequence[str]
     Returns:
         Dict[str, float]: Calculated metrics.
     """
-    parsed_measures = [ir_measures.parse_measure(measure) for measure in measures]
-    metrics = {str(measure): measure.calc_aggregate(qrels, run) for measure in parsed_measures}
+    parsed_measures = [_parse_measure(measure) for measure in measures]
+    # computing all measures in a single call converts the run and qrels only once
+    aggregated = ir_measures.calc_aggregate(parsed_measures, qrels, run)
+    metrics = {str(measure): aggregated[measure] for measure in parsed_measures}
     return metrics
@@ -200,7 +200,13 @@ class BiEncoderModel(LightningIRModel, ABC):
         num_docs_t = self._parse_num_docs(
             query_embeddings.embeddings.shape[0], doc_embeddings.embeddings.shape[0], num_docs, query_embeddings.device
         )
-        query_emb = query_embeddings.embeddings.repeat_interleave(num_docs_t, dim=0).unsqueeze(2)
+        return self._compute_similarity(query_embeddings, doc_embeddings, num_docs_t)
+
+    def _compute_similarity(
+        self, query_embeddings: BiEncoderEmbedding, doc_embeddings: BiEncoderEmbedding, num_docs: torch.Tensor
+    ) -> torch.Tensor:
+        """Computes the similarity scores given an already parsed tensor with the number of documents per query."""
+        query_emb = query_embeddings.embeddings.repeat_interleave(num_docs, dim=0).unsqueeze(2)
         doc_emb = doc_embeddings.embeddings.unsqueeze(1)
         similarity = self.similarity_function(query_emb, doc_emb)
         return similarity
@@ -209,7 +215,11 @@ class BiEncoderModel(LightningIRModel, ABC):
     @_batch_elementwise_scoring
     @torch.autocast(device_type="cuda", enabled=False)
     def _cosine_similarity(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-        return torch.nn.functional.cosine_similarity(x, y, dim=-1)
+        # NOTE normalize first and use a matmul, broadcasting torch.nn.functional.cosine_similarity materializes an
+        # intermediate tensor with a value for every query vector, document vector, and embedding dimension
+        x = x / x.norm(dim=-1, keepdim=True).clamp_min(1e-8)
+        y = y / y.norm(dim=-1, keepdim=True).clamp_min(1e-8)
+        return torch.matmul(x, y.transpose(-1, -2)).squeeze(-2)
 
     @staticmethod
     @_batch_elementwise_scoring
@@ -420,14 +430,26 @@ class MultiVectorBiEncoderModel(BiEncoderModel):
         Returns:
             torch.Tensor: Aggregated similarity scores.
         """
+        num_docs_t = None
+        if similarity.shape[-2] > 1:
+            num_docs_t = self._parse_num_docs(
+                query_scoring_mask.shape[0], doc_scoring_mask.shape[0], num_docs, similarity.device
+            )
+        return self._aggregate_similarity(similarity, query_scoring_mask, doc_scoring_mask, num_docs_t)
+
+    def _aggregate_similarity(
+        self,
+        similarity: torch.Tensor,
+        query_scoring_mask: torch.Tensor,
+        doc_scoring_mask: torch.Tensor,
+        num_docs: torch.Tensor | None,
+    ) -> torch.Tensor:
+        """Aggregates the similarities given an already parsed tensor with the number of documents per query."""
         scores = similarity
         if scores.shape[-1] > 1:
             scores = self._aggregate(scores, doc_scoring_mask, self.config.doc_aggregation_function, -1)
         if scores.shape[-2] > 1:
-            num_docs_t = self._parse_num_docs(
-                query_scoring_mask.shape[0], doc_scoring_mask.shape[0], num_docs, similarity.device
-            )
-            repeated_query_scoring_mask = query_scoring_mask.repeat_interleave(num_docs_t, dim=0)
+            repeated_query_scoring_mask = query_scoring_mask.repeat_interleave(num_docs, dim=0)
             scores = self._aggregate(scores, repeated_query_scoring_mask, self.config.query_aggregation_function, -2)
         return scores.view(scores.shape[0])
 
@@ -454,9 +476,12 @@ class MultiVectorBiEncoderModel(BiEncoderModel):
         if query_embeddings.scoring_mask is None or doc_embeddings.scoring_mask is None:
             raise ValueError("Scoring masks expected for scoring multi-vector embeddings")
 
-        similarity = self.compute_similarity(query_embeddings, doc_embeddings, num_docs)
-        scores = self.aggregate_similarity(
-            similarity, query_embeddings.scoring_mask, doc_embeddings.scoring_mask, num_docs
+        num_docs_t = self._parse_num_docs(
+            query_embeddings.embeddings.shape[0], doc_embeddings.embeddings.shape[0], num_docs, query_embeddings.device
+        )
+        similarity = self._compute_similarity(query_embeddings, doc_embeddings, num_docs_t)
+        scores = self._aggregate_similarity(
+            similarity, query_embeddings.scoring_mask, doc_embeddings.scoring_mask, num_docs_t
         )
         output.scores = scores
         output.similarity = similarity
@@ -32,18 +32,30 @@ class CrossEncoderTokenizer(LightningIRTokenizer):
         )
         self.tokenizer_pattern = tokenizer_pattern
 
-    def _truncate(self, text: Sequence[str], max_length: int) -> List[str]:
-        """Encodes a list of texts, truncates them to a maximum number of tokens and decodes them to strings."""
-        return self.batch_decode(
-            self(
-                text,
-                add_special_tokens=False,
-                truncation=True,
-                max_length=max_length,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            ).input_ids
-        )
+    def _truncate(self, queries: Sequence[str], docs: Sequence[str]) -> Tuple[List[str], List[str]]:
+        """Encodes queries and documents in a single call, truncates them to their respective maximum number of tokens
+        and decodes them to strings."""
+        num_queries = len(queries)
+        input_ids = self(
+            list(queries) + list(docs),
+            add_special_tokens=False,
+            truncation=True,
+            max_length=max(self.query_length, self.doc_length),
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        ).input_ids
+        # NOTE the shared call truncates to the longer of the two lengths, cut the shorter one from the same side the
+        # tokenizer truncates from so the result matches truncating queries and docs separately
+        if self.truncation_side == "left":
+            input_ids = [ids[max(len(ids) - self.query_length, 0) :] for ids in input_ids[:num_queries]] + [
+                ids[max(len(ids) - self.doc_length, 0) :] for ids in input_ids[num_queries:]
+            ]
+        else:
+            input_ids = [ids[: self.query_length] for ids in input_ids[:num_queries]] + [
+                ids[: self.doc_length] for ids in input_ids[num_queries:]
+            ]
+        truncated = self.batch_decode(input_ids)
+        return truncated[:num_queries], truncated[num_queries:]
 
     def _repeat_queries(self, queries: Sequence[str], num_docs: Sequence[int]) -> List[str]:
         """Repeats queries to match the number of documents."""
@@ -56,8 +68,8 @@ class CrossEncoderTokenizer(LightningIRTokenizer):
         num_docs: Sequence[int],
     ) -> Tuple[str | Sequence[str], str | Sequence[str]]:
         """Preprocesses queries and documents to ensure that they are truncated their respective maximum lengths."""
-        truncated_queries = self._repeat_queries(self._truncate(queries, self.query_length), num_docs)
-        truncated_docs = self._truncate(docs, self.doc_length)
+        truncated_queries, truncated_docs = self._truncate(queries, docs)
+        truncated_queries = self._repeat_queries(truncated_queries, num_docs)
         return truncated_queries, truncated_docs
 
     def _process_num_docs(
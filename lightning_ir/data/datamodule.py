@@ -119,6 +119,7 @@ class LightningIRDataModule(LightningDataModule):
             collate_fn=self._collate_fn,
             shuffle=(False if isinstance(self.train_dataset, IterableDataset) else self.shuffle_train),
             prefetch_factor=16 if self.num_workers > 0 else None,
+            persistent_workers=self.num_workers > 0,
         )
 
     def val_dataloader(self) -> List[DataLoader]:
@@ -159,6 +160,7 @@ class LightningIRDataModule(LightningDataModule):
                 num_workers=self.num_workers,
                 collate_fn=self._collate_fn,
                 prefetch_factor=16 if self.num_workers > 0 else None,
+                persistent_workers=self.num_workers > 0,
             )
             for dataset in inference_datasets
             if not dataset._SKIP
@@ -176,7 +178,7 @@ class LightningIRDataModule(LightningDataModule):
             "doc_ids": {"extend": False},
             "doc": {"extend": False},
             "docs": {"extend": False},
-            "targets": {"extend": True},
+            "targets": {"extend": False},
             "qrels": {"extend": True},
         }
         for sample in samples:
@@ -198,7 +200,7 @@ class LightningIRDataModule(LightningDataModule):
             kwargs["queries"] = kwargs["querys"]
             del kwargs["querys"]
         if "targets" in kwargs:
-            kwargs["targets"] = torch.stack(kwargs["targets"])
+            kwargs["targets"] = torch.cat(kwargs["targets"])
         return kwargs
 
     def _parse_batch(
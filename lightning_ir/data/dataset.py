@@ -13,8 +13,10 @@ from typing import Any, Dict, Iterator, Literal, Sequence, Tuple
 import ir_datasets
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import torch
 from ir_datasets.formats import GenericDoc, GenericDocPair
+from pyarrow import csv as pa_csv
 from torch.distributed import get_rank, get_world_size
 from torch.utils.data import Dataset, IterableDataset, get_worker_info
 
@@ -152,6 +154,21 @@ class IRDataset:
         self._qrels = qrels
         return self._qrels
 
+    def get_doc_texts(self, doc_ids: Sequence[str]) -> Tuple[str, ...]:
+        """Looks up the texts of multiple documents at once. If the documents are stored in an ir_datasets docs store,
+        all documents are fetched with a single batched lookup.
+
+        Args:
+            doc_ids (Sequence[str]): Ids of the documents.
+        Returns:
+            Tuple[str, ...]: Texts of the documents in the same order as the ids.
+        """
+        docs = self.docs
+        if isinstance(docs, ir_datasets.indices.Docstore):
+            docs = docs.get_many(doc_ids)
+            return tuple(docs[doc_id].default_text() for doc_id in doc_ids)
+        return tuple(docs.get(doc_id).default_text() for doc_id in doc_ids)
+
     def prepare_constituent(self, constituent: Literal["qrels", "queries", "docs", "scoreddocs", "docpairs"]) -> None:
         """Downloads the constituent of the dataset using ir_datasets if needed.
 
@@ -469,15 +486,34 @@ class RunDataset(IRDataset, Dataset):
             num_docs_per_query = self.run.groupby("query_id").transform("size")
             self.run = self.run[num_docs_per_query >= self.sample_size]
 
-        self.run = self.run.sort_values(["query_id", "rank"])
-        self.run_groups = self.run.groupby("query_id")
-        self.query_ids = list(self.run_groups.groups.keys())
+        self.run = self.run.sort_values(["query_id", "rank"]).reset_index(drop=True)
+        # rows of a query are contiguous after sorting, store the row offsets to slice groups without a groupby
+        num_docs_per_query = self.run.groupby("query_id", sort=False).size()
+        self.query_ids = list(num_docs_per_query.index)
+        self.query_offsets = np.concatenate([[0], np.cumsum(num_docs_per_query.values)])
 
         if self.depth != -1 and self.run["rank"].max() < self.depth:
             warnings.warn("Depth is greater than the maximum rank in the run file.")
 
     @staticmethod
     def _load_csv(path: Path) -> pd.DataFrame:
+        # NOTE parse with (multi-threaded) pyarrow if columns are separated by a single tab or space and fall back to
+        # pandas for arbitrary whitespace
+        for delimiter in ("\t", " "):
+            try:
+                return pa_csv.read_csv(
+                    path,
+                    read_options=pa_csv.ReadOptions(column_names=RUN_HEADER),
+                    parse_options=pa_csv.ParseOptions(delimiter=delimiter, quote_char=False),
+                    convert_options=pa_csv.ConvertOptions(
+                        include_columns=RUN_HEADER[:5],
+                        column_types={"query_id": pa.string(), "doc_id": pa.string()},
+                        strings_can_be_null=False,
+                        quoted_strings_can_be_null=False,
+                    ),
+                ).to_pandas()
+            except pa.ArrowInvalid:
+                continue
         return pd.read_csv(
             path,
             sep=r"\s+",
@@ -627,12 +663,12 @@ class RunDataset(IRDataset, Dataset):
         """
         self._setup()
         query_id = str(self.query_ids[idx])
-        group = self.run_groups.get_group(query_id).copy()
+        group = self.run.iloc[self.query_offsets[idx] : self.query_offsets[idx + 1]]
         query = self.queries[query_id]
         group = Sampler.sample(group, self.sample_size, self.sampling_strategy)
 
         doc_ids = tuple(group["doc_id"])
-        docs = tuple(self.docs.get(doc_id).default_text() for doc_id in doc_ids)
+        docs = self.get_doc_texts(doc_ids)
 
         targets = None
         if self.targets is not None:
@@ -701,7 +737,7 @@ class TupleDataset(IRDataset, IterableDataset):
             targets = targets[: self.num_docs]
         else:
             raise ValueError("Invalid sample type.")
-        docs = tuple(self.docs.get(doc_id).default_text() for doc_id in doc_ids)
+        docs = self.get_doc_texts(doc_ids)
         return doc_ids, docs, targets
 
     def __iter__(self) -> Iterator[RankSample]:
@@ -710,7 +746,11 @@ class TupleDataset(IRDataset, IterableDataset):
         Yields:
             RankSample: Sampled query and documents with targets.
         """
-        for sample in self.ir_dataset.docpairs_iter():
+        # shard tuples across dataloader workers to avoid yielding duplicates
+        worker_info = get_worker_info()
+        num_workers = worker_info.num_workers if worker_info is not None else 1
+        worker_id = worker_info.id if worker_info is not None else 0
+        for sample in islice(self.ir_dataset.docpairs_iter(), worker_id, None, num_workers):
             query_id = sample.query_id
             query = self.queries.loc[query_id]
             doc_ids, docs, targets = self._parse_sample(sample)
@@ -1,9 +1,16 @@
 import codecs
+import hashlib
 import json
+import os
+import warnings
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Literal, NamedTuple, Tuple, Type
+from typing import Any, Dict, Iterator, List, Literal, NamedTuple, Tuple, Type
 
 import ir_datasets
+import numpy as np
+import pyarrow as pa
+from filelock import FileLock
 from ir_datasets.datasets.base import Dataset
 from ir_datasets.datasets.nano_beir import parquet_iter
 from ir_datasets.formats import (
@@ -18,6 +25,7 @@ from ir_datasets.formats import (
     tsv,
 )
 from ir_datasets.util import Cache, DownloadConfig
+from pyarrow import csv as pa_csv
 
 CONSTITUENT_TYPE_MAP: Dict[str, Dict[str, Type]] = {
     "docs": {
@@ -122,28 +130,175 @@ class ScoredDocTuples(BaseDocPairs):
         return self._docpairs_dlc.path()
 
     def docpairs_iter(self):
-        file_type = None
-        if self._docpairs_dlc.path().suffix == ".json":
-            file_type = "json"
-        elif self._docpairs_dlc.path().suffix in (".tsv", ".run"):
-            file_type = "tsv"
+        suffix = self._docpairs_dlc.path().suffix
+        if suffix == ".json":
+            yield from self._json_iter()
+        elif suffix in (".tsv", ".run"):
+            yield from self._tsv_iter()
         else:
-            raise ValueError(f"Unknown file type: {self._docpairs_dlc.path().suffix}")
+            raise ValueError(f"Unknown file type: {suffix}")
+
+    def _json_iter(self):
         with self._docpairs_dlc.stream() as f:
             f = codecs.getreader("utf8")(f)
             for line in f:
-                if file_type == "json":
-                    data = json.loads(line)
-                    qid, *doc_data = data
-                    pids, scores = zip(*doc_data)
-                    pids = tuple(str(pid) for pid in pids)
-                else:
-                    cols = line.rstrip().split()
-                    pos_score, neg_score, qid, pid1, pid2 = cols
-                    pids = (pid1, pid2)
-                    scores = (float(pos_score), float(neg_score))
+                qid, *doc_data = json.loads(line)
+                pids, scores = zip(*doc_data)
+                pids = tuple(str(pid) for pid in pids)
                 yield ScoredDocTuple(str(qid), pids, scores, len(pids))
 
+    _TSV_COLUMN_TYPES = {
+        "pos_score": pa.float64(),
+        "neg_score": pa.float64(),
+        "query_id": pa.string(),
+        "doc_id_1": pa.string(),
+        "doc_id_2": pa.string(),
+    }
+    _RECORD_DTYPE = np.dtype(
+        [
+            ("query_idx", np.int32),
+            ("doc_idx_1", np.int32),
+            ("doc_idx_2", np.int32),
+            ("pos_score", np.float64),
+            ("neg_score", np.float64),
+        ]
+    )
+    _CACHE_VERSION = 2
+    _CHUNK_SIZE = 65_536
+
+    def _tsv_batches(self) -> Iterator[Tuple[List[float], List[float], List[str], List[str], List[str]]]:
+        """Parses the (pos_score, neg_score, qid, pid1, pid2) columns in batches with pyarrow. Falls back to splitting
+        lines on arbitrary whitespace if the columns are not separated by single tabs."""
+        num_rows = 0
+        try:
+            with self._docpairs_dlc.stream() as f:
+                reader = pa_csv.open_csv(
+                    f,
+                    read_options=pa_csv.ReadOptions(column_names=list(self._TSV_COLUMN_TYPES)),
+                    parse_options=pa_csv.ParseOptions(delimiter="\t", quote_char=False),
+                    convert_options=pa_csv.ConvertOptions(column_types=self._TSV_COLUMN_TYPES),
+                )
+                for batch in reader:
+                    pos_scores, neg_scores, qids, pids_1, pids_2 = (
+                        batch.column(name).to_pylist() for name in self._TSV_COLUMN_TYPES
+                    )
+                    num_rows += batch.num_rows
+                    yield pos_scores, neg_scores, qids, pids_1, pids_2
+            return
+        except pa.ArrowInvalid:
+            pass
+        # NOTE skip the rows pyarrow already yielded before hitting a line it could not parse
+        with self._docpairs_dlc.stream() as f:
+            lines = (line for line in codecs.getreader("utf8")(f) if line.strip())
+            lines = islice(lines, num_rows, None)
+            while chunk := list(islice(lines, self._CHUNK_SIZE)):
+                pos_scores, neg_scores, qids, pids_1, pids_2 = [], [], [], [], []
+                for line in chunk:
+                    pos_score, neg_score, qid, pid1, pid2 = line.split()
+                    pos_scores.append(float(pos_score))
+                    neg_scores.append(float(neg_score))
+                    qids.append(qid)
+                    pids_1.append(pid1)
+                    pids_2.append(pid2)
+                yield pos_scores, neg_scores, qids, pids_1, pids_2
+
+    @staticmethod
+    def _cache_dir(path: Path) -> Path:
+        return (
+            ir_datasets.util.home_path()
+            / "lightning-ir"
+            / "docpairs"
+            / hashlib.sha256(str(path).encode()).hexdigest()[:16]
+        )
+
+    def _cache_metadata(self, path: Path) -> Dict[str, Any]:
+        stat = path.stat()
+        return {
+            "version": self._CACHE_VERSION,
+            "path": str(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    @staticmethod
+    def _cache_is_valid(cache_dir: Path, metadata: Dict[str, Any]) -> bool:
+        try:
+            return json.loads((cache_dir / "metadata.json").read_text()) == metadata
+        except (OSError, ValueError):
+            return False
+
+    def _build_tsv_cache(self, cache_dir: Path, metadata: Dict[str, Any]) -> None:
+        # NOTE records are appended batch by batch and the id tables grow with every new id, so the file is never
+        # materialized as a whole. all files are written to temporary paths and renamed, the metadata is written last
+        # so it only matches the source once the cache is complete
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_suffix = f".{os.getpid()}.tmp"
+        tmp_paths = [cache_dir / f"{name}{tmp_suffix}" for name in ("records.bin", "query_ids.npy", "doc_ids.npy")]
+        query_vocab: Dict[str, int] = {}
+        doc_vocab: Dict[str, int] = {}
+        try:
+            with open(tmp_paths[0], "wb") as f:
+                for pos_scores, neg_scores, qids, pids_1, pids_2 in self._tsv_batches():
+                    records = np.empty(len(qids), dtype=self._RECORD_DTYPE)
+                    records["query_idx"] = [query_vocab.setdefault(qid, len(query_vocab)) for qid in qids]
+                    records["doc_idx_1"] = [doc_vocab.setdefault(pid, len(doc_vocab)) for pid in pids_1]
+                    records["doc_idx_2"] = [doc_vocab.setdefault(pid, len(doc_vocab)) for pid in pids_2]
+                    records["pos_score"] = pos_scores
+                    records["neg_score"] = neg_scores
+                    records.tofile(f)
+            for tmp_path, vocab in zip(tmp_paths[1:], (query_vocab, doc_vocab)):
+                with open(tmp_path, "wb") as f:
+                    np.save(f, np.array(list(vocab), dtype=str))
+            for tmp_path in tmp_paths:
+                os.replace(tmp_path, cache_dir / tmp_path.name.removesuffix(tmp_suffix))
+            metadata_path = cache_dir / f"metadata.json{tmp_suffix}"
+            metadata_path.write_text(json.dumps(metadata))
+            os.replace(metadata_path, cache_dir / "metadata.json")
+        finally:
+            for tmp_path in tmp_paths:
+                tmp_path.unlink(missing_ok=True)
+
+    def _cached_iter(self, cache_dir: Path) -> Iterator[ScoredDocTuple]:
+        records_path = cache_dir / "records.bin"
+        if not records_path.stat().st_size:
+            return
+        records = np.memmap(records_path, dtype=self._RECORD_DTYPE, mode="r")
+        query_ids = np.load(cache_dir / "query_ids.npy", mmap_mode="r")
+        doc_ids = np.load(cache_dir / "doc_ids.npy", mmap_mode="r")
+        for start in range(0, records.shape[0], self._CHUNK_SIZE):
+            chunk = records[start : start + self._CHUNK_SIZE]
+            columns = (
+                query_ids[chunk["query_idx"]].tolist(),
+                doc_ids[chunk["doc_idx_1"]].tolist(),
+                doc_ids[chunk["doc_idx_2"]].tolist(),
+                chunk["pos_score"].tolist(),
+                chunk["neg_score"].tolist(),
+            )
+            for qid, pid1, pid2, pos_score, neg_score in zip(*columns):
+                yield ScoredDocTuple(qid, (pid1, pid2), (pos_score, neg_score), 2)
+
+    def _tsv_iter(self) -> Iterator[ScoredDocTuple]:
+        # NOTE the first iteration converts the tsv into a fixed-width record file with deduplicated id tables in the
+        # ir_datasets home, subsequent iterations memory-map it instead of re-parsing the text until the file changes
+        path = self._docpairs_dlc.path().resolve()
+        metadata = self._cache_metadata(path)
+        try:
+            cache_dir = self._cache_dir(path)
+            if not self._cache_is_valid(cache_dir, metadata):
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                # NOTE only one process (e.g., one of several dataloader workers) parses the file, the others wait
+                # for the lock and then read the finished cache
+                with FileLock(cache_dir / "build.lock"):
+                    if not self._cache_is_valid(cache_dir, metadata):
+                        self._build_tsv_cache(cache_dir, metadata)
+        except OSError as e:
+            warnings.warn(f"Unable to cache docpairs of {self._docpairs_dlc.path()}, parsing the file instead: {e}")
+            for pos_scores, neg_scores, qids, pids_1, pids_2 in self._tsv_batches():
+                for pos_score, neg_score, qid, pid1, pid2 in zip(pos_scores, neg_scores, qids, pids_1, pids_2):
+                    yield ScoredDocTuple(qid, (pid1, pid2), (pos_score, neg_score), 2)
+            return
+        yield from self._cached_iter(cache_dir)
+
     def docpairs_cls(self):
         return ScoredDocTuple
 
@@ -159,26 +159,26 @@ class CoilModel(MultiVectorBiEncoderModel):
         ):
             raise ValueError("COIL embeddings must contain cls_embeddings and token_embeddings")
 
-        cls_scores = self.compute_similarity(
+        num_docs_t = self._parse_num_docs(
+            query_embeddings.embeddings.shape[0], doc_embeddings.embeddings.shape[0], num_docs, query_embeddings.device
+        )
+        cls_scores = self._compute_similarity(
             BiEncoderEmbedding(query_embeddings.cls_embeddings),
             BiEncoderEmbedding(doc_embeddings.cls_embeddings),
-            num_docs,
+            num_docs_t,
         ).view(-1)
 
-        token_similarity = self.compute_similarity(
+        token_similarity = self._compute_similarity(
             BiEncoderEmbedding(query_embeddings.token_embeddings),
             BiEncoderEmbedding(doc_embeddings.token_embeddings),
-            num_docs,
-        )
-        num_docs_t = self._parse_num_docs(
-            query_embeddings.embeddings.shape[0], doc_embeddings.embeddings.shape[0], num_docs, query_embeddings.device
+            num_docs_t,
         )
         query = query_embeddings.encoding.input_ids.repeat_interleave(num_docs_t, 0)[:, 1:]
         docs = doc_embeddings.encoding.input_ids[:, 1:]
         mask = (query[:, :, None] == docs[:, None, :]).to(token_similarity)
         token_similarity = token_similarity * mask
-        token_scores = self.aggregate_similarity(
-            token_similarity, query_embeddings.scoring_mask[:, 1:], doc_embeddings.scoring_mask[:, 1:], num_docs
+        token_scores = self._aggregate_similarity(
+            token_similarity, query_embeddings.scoring_mask[:, 1:], doc_embeddings.scoring_mask[:, 1:], num_docs_t
         )
 
         output.scores = cls_scores + token_scores
@@ -1,4 +1,6 @@
 import warnings
+from functools import cache
+from typing import Dict
 
 import torch
 from huggingface_hub import hf_hub_download
@@ -8,14 +10,26 @@ from .base import CHECKPOINT_MAPPING, POST_LOAD_CALLBACKS, STATE_DICT_KEY_MAPPIN
 from .models import CoilConfig, ColConfig, DprConfig, MonoConfig, SpladeConfig
 
 
+@cache
+def _load_external_state_dict(
+    model_name_or_path: str, filename: str, subfolder: str | None = None
+) -> Dict[str, torch.Tensor]:
+    # NOTE cached so that repeatedly instantiating the same checkpoint (e.g., multiple fits in one process) does not
+    # re-read the weights from disk, call `_load_external_state_dict.cache_clear()` to free the memory
+    path = hf_hub_download(model_name_or_path, filename=filename, subfolder=subfolder)
+    if filename.endswith(".safetensors"):
+        return load_file(path)
+    return torch.load(path, map_location="cpu")
+
+
 def _map_colbert_marker_tokens(model: LightningIRModel) -> LightningIRModel:
     config = model.config
     query_token_id = config.vocab_size
     doc_token_id = config.vocab_size + 1
-    model.resize_token_embeddings(config.vocab_size + 2, 8)
+    # NOTE the new rows are overwritten below, skip initializing them from the embedding mean and covariance
+    model.resize_token_embeddings(config.vocab_size + 2, 8, mean_resizing=False)
     embeddings = model.embeddings.word_embeddings.weight.data
-    embeddings[query_token_id] = embeddings[1]  # [unused0]
-    embeddings[doc_token_id] = embeddings[2]  # [unused1]
+    embeddings[[query_token_id, doc_token_id]] = embeddings[[1, 2]]  # [unused0], [unused1]
     return model
 
 
@@ -23,13 +37,11 @@ def _map_moderncolbert_marker_tokens(model: LightningIRModel) -> LightningIRMode
     config = model.config
     query_token_id = config.vocab_size
     doc_token_id = config.vocab_size + 1
-    model.resize_token_embeddings(config.vocab_size + 2, 8)
+    model.resize_token_embeddings(config.vocab_size + 2, 8, mean_resizing=False)
     embeddings = model.embeddings.tok_embeddings.weight.data
-    embeddings[query_token_id] = embeddings[50368]  # [unused0]
-    embeddings[doc_token_id] = embeddings[50369]  # [unused1]
+    embeddings[[query_token_id, doc_token_id]] = embeddings[[50368, 50369]]  # [unused0], [unused1]
 
-    path = hf_hub_download(model.config.name_or_path, filename="model.safetensors", subfolder="1_Dense")
-    state_dict = load_file(path)
+    state_dict = dict(_load_external_state_dict(model.config.name_or_path, "model.safetensors", "1_Dense"))
     state_dict["weight"] = state_dict.pop("linear.weight")
     model.projection.load_state_dict(state_dict)
     return model
@@ -56,8 +68,7 @@ def _map_rank_t5_weights(model: LightningIRModel) -> LightningIRModel:
 
 
 def _map_coil_weights(model: LightningIRModel) -> LightningIRModel:
-    path = hf_hub_download(model.config.name_or_path, filename="model.pt")
-    state_dict = torch.load(path, map_location="cpu")
+    state_dict = dict(_load_external_state_dict(model.config.name_or_path, "model.pt"))
     state_dict["token_projection.weight"] = state_dict.pop("tok_proj.weight")
     state_dict["token_projection.bias"] = state_dict.pop("tok_proj.bias")
     state_dict["cls_projection.weight"] = state_dict.pop("cls_proj.weight")
@@ -1,5 +1,6 @@
 import array
 from pathlib import Path
+from typing import Literal
 
 import torch
 
@@ -70,6 +71,11 @@ class TorchDenseIndexer(Indexer):
         """Save the index to the specified directory."""
         super().save()
         index = torch.frombuffer(self.embeddings, dtype=torch.float32).view(self.num_embeddings, -1)
+        if self.index_config.quantization == "int8":
+            # NOTE symmetric per-vector quantization, stores a quarter of the fp32 bytes plus one scale per vector
+            scales = index.abs().amax(dim=1).clamp_min(torch.finfo(torch.float32).tiny) / 127
+            index = torch.round(index / scales[:, None]).to(torch.int8)
+            torch.save(scales, self.index_dir / "scales.pt")
         torch.save(index, self.index_dir / "index.pt")
 
 
@@ -78,3 +84,18 @@ class TorchDenseIndexConfig(IndexConfig):
 
     indexer_class = TorchDenseIndexer
     SUPPORTED_MODELS = {ColConfig.model_type, DprConfig.model_type}
+
+    def __init__(self, quantization: Literal["fp32", "int8"] = "fp32") -> None:
+        """Initialize the TorchDenseIndexConfig.
+
+        Args:
+            quantization (Literal["fp32", "int8"]): Precision in which the embeddings are stored. With "int8", each
+                embedding is scaled to the int8 range by its maximum absolute value and dequantized block-wise during
+                search. Defaults to "fp32".
+        Raises:
+            ValueError: If the quantization is not supported.
+        """
+        super().__init__()
+        if quantization not in ("fp32", "int8"):
+            raise ValueError(f"Unknown quantization: {quantization}")
+        self.quantization = quantization
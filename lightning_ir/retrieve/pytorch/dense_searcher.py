@@ -31,6 +31,9 @@ class TorchDenseIndex:
         """
         self.index = torch.load(index_dir / "index.pt", weights_only=True)
         self.config = TorchDenseIndexConfig.from_pretrained(index_dir)
+        self.scales = None
+        if self.config.quantization == "int8":
+            self.scales = torch.load(index_dir / "scales.pt", weights_only=True)
         if similarity_function == "dot":
             self.similarity_function = self.dot_similarity
         elif similarity_function == "cosine":
@@ -49,6 +52,9 @@ class TorchDenseIndex:
         """
         embeddings = embeddings.to(self.device)
         similarity = self.similarity_function(embeddings, self.index)
+        # NOTE cosine similarity is invariant to the per-vector quantization scales, only dot products are rescaled
+        if self.scales is not None and self.similarity_function == self.dot_similarity:
+            similarity = similarity * self.scales
         return similarity
 
     @property
@@ -68,6 +74,7 @@ class TorchDenseIndex:
         Returns:
             torch.Tensor: Cosine similarity scores.
         """
+        y = y.to(x.dtype)
         return torch.nn.functional.cosine_similarity(x[:, None], y[None], dim=-1)
 
     @staticmethod
@@ -82,11 +89,14 @@ class TorchDenseIndex:
         Returns:
             torch.Tensor: Dot product similarity scores.
         """
+        y = y.to(x.dtype)
         return torch.matmul(x, y.T)
 
     def to_gpu(self) -> None:
         """Convert the index to GPU format."""
         self.index = self.index.to(self.device)
+        if self.scales is not None:
+            self.scales = self.scales.to(self.device)
 
 
 class TorchDenseSearcher(ExactSearcher):
@@ -4,6 +4,7 @@ from typing import Sequence
 import ir_datasets
 import pandas as pd
 import pytest
+import torch
 from _pytest.fixtures import SubRequest
 
 from lightning_ir import BiEncoderModule, LightningIRDataModule, LightningIRModule, LightningIRTrainer, RunDataset
@@ -21,6 +22,7 @@ from lightning_ir.retrieve import (
     SeismicSearchConfig,
     TorchDenseIndexConfig,
     TorchDenseSearchConfig,
+    TorchDenseSearcher,
     TorchSparseIndexConfig,
     TorchSparseSearchConfig,
 )
@@ -34,10 +36,11 @@ from .conftest import CORPUS_DIR, DATA_DIR
         FaissIVFIndexConfig(num_centroids=16),
         TorchSparseIndexConfig(),
         TorchDenseIndexConfig(),
+        TorchDenseIndexConfig(quantization="int8"),
         PlaidIndexConfig(num_centroids=8, num_train_embeddings=1_024),
         SeismicIndexConfig(num_postings=32),
     ],
-    ids=["Faiss", "FaissIVF", "Sparse", "Dense", "Plaid", "Seismic"],
+    ids=["Faiss", "FaissIVF", "Sparse", "Dense", "DenseInt8", "Plaid", "Seismic"],
 )
 def index_config(request: SubRequest) -> IndexConfig:
     return request.param
@@ -89,8 +92,7 @@ def test_index_callback(
     assert (index_dir / "doc_ids.txt").exists()
     doc_ids_path = index_dir / "doc_ids.txt"
     doc_ids = doc_ids_path.read_text().split()
-    for idx, doc_id in enumerate(doc_ids):
-        assert doc_id == f"doc_id_{idx + 1}"
+    assert doc_ids == [f"doc_id_{idx + 1}" for idx in range(len(doc_ids))]
     assert (index_dir / "config.json").exists()
 
 
@@ -98,8 +100,8 @@ def get_index(
     bi_encoder_module: BiEncoderModule,
     doc_datamodule: LightningIRDataModule,
     search_config: SearchConfig,
+    index_config: IndexConfig | None = None,
 ) -> Path:
-    index_config: IndexConfig
     if isinstance(search_config, FaissSearchConfig):
         index_type = "faiss"
         index_config = FaissFlatIndexConfig()
@@ -108,7 +110,10 @@ def get_index(
         index_config = TorchSparseIndexConfig()
     elif isinstance(search_config, TorchDenseSearchConfig):
         index_type = "dense"
-        index_config = TorchDenseIndexConfig()
+        if not isinstance(index_config, TorchDenseIndexConfig):
+            index_config = TorchDenseIndexConfig()
+        if index_config.quantization != "fp32":
+            index_type = f"dense-{index_config.quantization}"
     elif isinstance(search_config, PlaidSearchConfig):
         index_type = "plaid"
         index_config = PlaidIndexConfig(num_centroids=8, num_train_embeddings=1_024)
@@ -137,16 +142,17 @@ def get_index(
 
 
 @pytest.mark.parametrize(
-    "search_config",
+    "search_config,index_config",
     (
-        FaissSearchConfig(k=3, imputation_strategy="min", candidate_k=3),
-        FaissSearchConfig(k=3, imputation_strategy="gather", candidate_k=3),
-        PlaidSearchConfig(k=3, centroid_score_threshold=0),
-        TorchSparseSearchConfig(k=3),
-        TorchDenseSearchConfig(k=3),
-        SeismicSearchConfig(k=3),
+        (FaissSearchConfig(k=3, imputation_strategy="min", candidate_k=3), None),
+        (FaissSearchConfig(k=3, imputation_strategy="gather", candidate_k=3), None),
+        (PlaidSearchConfig(k=3, centroid_score_threshold=0), None),
+        (TorchSparseSearchConfig(k=3), None),
+        (TorchDenseSearchConfig(k=3), None),
+        (TorchDenseSearchConfig(k=3), TorchDenseIndexConfig(quantization="int8")),
+        (SeismicSearchConfig(k=3), None),
     ),
-    ids=["FaissMin", "FaissGather", "Plaid", "Sparse", "Dense", "Seismic"],
+    ids=["FaissMin", "FaissGather", "Plaid", "Sparse", "Dense", "DenseInt8", "Seismic"],
 )
 def test_search_callback(
     tmp_path: Path,
@@ -154,6 +160,7 @@ def test_search_callback(
     query_datamodule: LightningIRDataModule,
     doc_datamodule: LightningIRDataModule,
     search_config: SearchConfig,
+    index_config: IndexConfig | None,
 ):
 
     if bi_encoder_module.config.model_type not in search_config.SUPPORTED_MODELS:
@@ -162,7 +169,7 @@ def test_search_callback(
             f"{search_config.__class__.__name__} searcher"
         )
 
-    index_dir = get_index(bi_encoder_module, doc_datamodule, search_config)
+    index_dir = get_index(bi_encoder_module, doc_datamodule, search_config, index_config)
     save_dir = tmp_path / "runs"
     search_callback = SearchCallback(search_config=search_config, index_dir=index_dir, save_dir=save_dir, use_gpu=False)
 
@@ -187,6 +194,44 @@ def test_search_callback(
         assert run_df["query_id"].nunique() == len(dataset)
 
 
+@pytest.mark.parametrize("similarity_function", ["dot", "cosine"])
+def test_dense_int8_search(
+    tmp_path: Path,
+    bi_encoder_module: BiEncoderModule,
+    query_datamodule: LightningIRDataModule,
+    doc_datamodule: LightningIRDataModule,
+    similarity_function: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    if bi_encoder_module.config.model_type not in TorchDenseIndexConfig.SUPPORTED_MODELS:
+        pytest.skip(f"Dense indexing not supported for {bi_encoder_module.config.__class__.__name__} model")
+    monkeypatch.setattr(bi_encoder_module.config, "similarity_function", similarity_function)
+    monkeypatch.setattr(bi_encoder_module, "_searcher", None)
+
+    assert doc_datamodule.inference_datasets is not None
+    dataset_id = doc_datamodule.inference_datasets[0].dataset_id
+    searchers = {}
+    for quantization in ("fp32", "int8"):
+        index_dir = tmp_path / quantization
+        index_config = TorchDenseIndexConfig(quantization=quantization)
+        index_callback = IndexCallback(index_config=index_config, index_dir=index_dir)
+        trainer = LightningIRTrainer(logger=False, enable_checkpointing=False, callbacks=[index_callback])
+        trainer.index(bi_encoder_module, datamodule=doc_datamodule)
+        searchers[quantization] = TorchDenseSearcher(
+            index_dir / dataset_id, TorchDenseSearchConfig(k=3), bi_encoder_module, use_gpu=False
+        )
+
+    batch = next(iter(query_datamodule.test_dataloader()[0]))
+    with torch.no_grad():
+        query_embeddings = bi_encoder_module.forward(batch).query_embeddings
+    fp32_scores = searchers["fp32"]._score(query_embeddings)
+    int8_scores = searchers["int8"]._score(query_embeddings)
+
+    # quantizing each component to 1/254 of the vector's maximum magnitude keeps scores within a few percent
+    assert int8_scores.shape == fp32_scores.shape
+    torch.testing.assert_close(int8_scores, fp32_scores, rtol=0, atol=0.02 * fp32_scores.abs().max().item())
+
+
 def test_rerank_callback(tmp_path: Path, module: LightningIRModule, inference_datasets: Sequence[RunDataset]):
     datamodule = run_datamodule(module, inference_datasets)
     save_dir = tmp_path / "runs"
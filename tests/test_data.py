@@ -1,11 +1,18 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Sequence
 
+import ir_datasets
 import pytest
 import torch
+from ir_datasets.util import Cache
+from torch.utils.data import DataLoader
 
 from lightning_ir.data.data import IndexBatch, SearchBatch, TrainBatch
 from lightning_ir.data.datamodule import LightningIRDataModule
 from lightning_ir.data.dataset import RunDataset, TupleDataset
+from lightning_ir.data.external_datasets.ir_datasets_utils import ScoredDocTuple, ScoredDocTuples
 
 from .conftest import RUNS_DIR
 
@@ -138,6 +145,21 @@ def test_tuples_dataset(tuples_datamodule: LightningIRDataModule):
     assert batch.targets.shape[0] == dataloader.batch_size * dataset.num_docs
 
 
+def _identity(sample):
+    return sample
+
+
+def test_tuples_dataset_worker_sharding():
+    dataset = TupleDataset("lightning-ir", targets="order", num_docs=2)
+    expected = sorted((sample.query_id, sample.doc_ids) for sample in dataset)
+
+    dataloader = DataLoader(dataset, batch_size=None, num_workers=2, collate_fn=_identity)
+    samples = sorted((sample.query_id, sample.doc_ids) for sample in dataloader)
+
+    assert expected
+    assert samples == expected
+
+
 def test_query_dataset(query_datamodule: LightningIRDataModule):
     dataloader = query_datamodule.test_dataloader()[0]
     batch: SearchBatch = next(iter(dataloader))
@@ -174,3 +196,77 @@ def test_json_dataset():
     assert sample is not None
     assert sample.query_id is not None
     assert len(sample.doc_ids) == 5
+
+
+def test_scored_doc_tuples_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    home_path = tmp_path / "ir_datasets"
+    monkeypatch.setattr(ir_datasets.util, "home_path", lambda: home_path)
+    docpairs_path = tmp_path / "docpairs.tsv"
+    docpairs_path.write_text("1.5\t-2.25\tq1\tp1\tp2\n0.1\t0.3\tq2\tp3\tp1\n")
+    docpairs = ScoredDocTuples(Cache(None, docpairs_path))
+
+    # first iteration builds the cache, scores keep their full precision
+    assert list(docpairs.docpairs_iter()) == [
+        ScoredDocTuple("q1", ("p1", "p2"), (1.5, -2.25), 2),
+        ScoredDocTuple("q2", ("p3", "p1"), (0.1, 0.3), 2),
+    ]
+    (cache_dir,) = (home_path / "lightning-ir" / "docpairs").iterdir()
+    assert (cache_dir / "records.bin").exists()
+    assert (cache_dir / "metadata.json").exists()
+
+    # subsequent iterations read the cache without parsing the file
+    with monkeypatch.context() as m:
+        m.setattr(ScoredDocTuples, "_tsv_batches", lambda self: pytest.fail("cache was not reused"))
+        assert len(list(docpairs.docpairs_iter())) == 2
+
+    # changing the file invalidates the cache
+    docpairs_path.write_text("2.0\t1.0\tq3\tp4\tp5\n")
+    assert list(docpairs.docpairs_iter()) == [ScoredDocTuple("q3", ("p4", "p5"), (2.0, 1.0), 2)]
+
+
+def test_scored_doc_tuples_cache_built_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ir_datasets.util, "home_path", lambda: tmp_path / "ir_datasets")
+    docpairs_path = tmp_path / "docpairs.tsv"
+    docpairs_path.write_text("1.5\t-2.25\tq1\tp1\tp2\n")
+    docpairs = ScoredDocTuples(Cache(None, docpairs_path))
+
+    num_builds = 0
+    build_tsv_cache = ScoredDocTuples._build_tsv_cache
+
+    def slow_build_tsv_cache(self, *args):
+        nonlocal num_builds
+        num_builds += 1
+        time.sleep(0.2)
+        build_tsv_cache(self, *args)
+
+    monkeypatch.setattr(ScoredDocTuples, "_build_tsv_cache", slow_build_tsv_cache)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: list(docpairs.docpairs_iter()), range(4)))
+
+    assert num_builds == 1
+    assert all(result == [ScoredDocTuple("q1", ("p1", "p2"), (1.5, -2.25), 2)] for result in results)
+
+
+def test_scored_doc_tuples_unwritable_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # a file in place of the ir_datasets home makes creating the cache directory fail
+    home_path = tmp_path / "ir_datasets"
+    home_path.touch()
+    monkeypatch.setattr(ir_datasets.util, "home_path", lambda: home_path)
+    docpairs_path = tmp_path / "docpairs.tsv"
+    docpairs_path.write_text("0.1\t-2.25\tq1\tp1\tp2\n")
+    docpairs = ScoredDocTuples(Cache(None, docpairs_path))
+
+    with pytest.warns(UserWarning, match="Unable to cache docpairs"):
+        assert list(docpairs.docpairs_iter()) == [ScoredDocTuple("q1", ("p1", "p2"), (0.1, -2.25), 2)]
+
+
+def test_scored_doc_tuples_whitespace_separated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ir_datasets.util, "home_path", lambda: tmp_path / "ir_datasets")
+    docpairs_path = tmp_path / "docpairs.run"
+    docpairs_path.write_text("1.5 -2.25 q1 p1 p2\n0.5\t 0.25  q2 p3\tp1\n")
+    docpairs = ScoredDocTuples(Cache(None, docpairs_path))
+
+    assert list(docpairs.docpairs_iter()) == [
+        ScoredDocTuple("q1", ("p1", "p2"), (1.5, -2.25), 2),
+        ScoredDocTuple("q2", ("p3", "p1"), (0.5, 0.25), 2),
+    ]
@@ -79,3 +79,31 @@ def test_cross_encoder_tokenizer(cross_encoder_config: CrossEncoderConfig, model
     doc = "Paris is the capital of France."
     with pytest.raises(ValueError):
         encoding = tokenizer.tokenize(query, doc)["encoding"]
+
+
+@pytest.mark.parametrize("truncation_side", ["right", "left"])
+def test_cross_encoder_tokenizer_truncation(
+    cross_encoder_config: CrossEncoderConfig, model_name_or_path: str, truncation_side: str
+):
+    Tokenizer = LightningIRTokenizerClassFactory(type(cross_encoder_config)).from_pretrained(model_name_or_path)
+    tokenizer = Tokenizer.from_pretrained(
+        model_name_or_path, query_length=4, doc_length=6, truncation_side=truncation_side
+    )
+
+    queries = ["What is the capital of France?", "capital"]
+    docs = ["Paris is the capital and largest city of France.", "Paris", "Berlin is the capital of Germany."]
+    truncated_queries, truncated_docs = tokenizer._truncate(queries, docs)
+
+    def truncate(texts, max_length):
+        input_ids = tokenizer(
+            texts,
+            add_special_tokens=False,
+            truncation=True,
+            max_length=max_length,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        ).input_ids
+        return tokenizer.batch_decode(input_ids)
+
+    assert truncated_queries == truncate(queries, tokenizer.query_length)
+    assert truncated_docs == truncate(docs, tokenizer.doc_length)
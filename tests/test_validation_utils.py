@@ -0,0 +1,43 @@
+import pandas as pd
+import torch
+
+from lightning_ir.base.validation_utils import create_run_from_scores, evaluate_run
+
+
+def test_create_run_from_scores():
+    query_ids = ["q2", "q1"]
+    doc_ids = [["d1", "d2", "d3"], ["d4", "d5"]]
+    scores = torch.tensor([1.0, 3.0, 1.0, 0.5, 2.0])
+
+    run = create_run_from_scores(query_ids, doc_ids, scores)
+
+    # queries keep their input order, docs are sorted by descending score and ties keep their input order
+    assert run["query_id"].astype(str).tolist() == ["q2", "q2", "q2", "q1", "q1"]
+    assert run["doc_id"].tolist() == ["d2", "d1", "d3", "d5", "d4"]
+    assert run["score"].tolist() == [3.0, 1.0, 1.0, 2.0, 0.5]
+    assert run["rank"].tolist() == [1, 2, 3, 1, 2]
+    assert (run["q0"] == 0).all()
+    assert (run["system"] == "lightning_ir").all()
+
+
+def test_create_run_from_scores_duplicate_query_ids():
+    query_ids = ["q1", "q2", "q1"]
+    doc_ids = [["d1", "d2"], ["d3"], ["d4", "d5"]]
+    scores = torch.tensor([1.0, 4.0, 1.0, 3.0, 1.0])
+
+    run = create_run_from_scores(query_ids, doc_ids, scores)
+
+    # blocks of the same query id are ranked together at the position of the last occurrence
+    assert run["query_id"].astype(str).tolist() == ["q2", "q1", "q1", "q1", "q1"]
+    assert run["doc_id"].tolist() == ["d3", "d2", "d4", "d1", "d5"]
+    assert run["rank"].tolist() == [1, 1, 2, 3, 4]
+
+
+def test_evaluate_run_categorical_query_ids():
+    run = create_run_from_scores(["q1", "q2"], [["d1", "d2"], ["d3", "d4"]], torch.tensor([2.0, 1.0, 1.0, 2.0]))
+    qrels = pd.DataFrame({"query_id": ["q1", "q2"], "doc_id": ["d1", "d3"], "relevance": [1, 1]})
+
+    metrics = evaluate_run(run, qrels, ["RR@10"])
+    string_metrics = evaluate_run(run.assign(query_id=run["query_id"].astype(str)), qrels, ["RR@10"])
+
+    assert metrics == string_metrics == {"RR@10": 0.75}